@@ -9,7 +9,7 @@ from app_pages.activities_page import page_activities_body
 app = Multipage("Option Clarifieer")
 #app.add_page("Start", page_start_body)
 app.add_page("Housing", page_housing_body)
-#app.add_page("Hotels", page_hotels_body)
-#app.add_page("Activities", page_activities_body)
+app.add_page("Hotels", page_hotels_body)
+app.add_page("Activities", page_activities_body)
 
 app.run()
\ No newline at end of file
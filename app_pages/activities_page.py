@@ -1,6 +1,7 @@
-import streamlit as st
+from app_pages.category_page import category_page_body
 
 def page_activities_body(app):
-    st.header("Activities")
-    st.write("Welcome to the Activities Comparison page.")
-
+    category_page_body(
+        "Activities", "Activities",
+        "Welcome to the Activities Comparison page."
+    )
@@ -0,0 +1,173 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+
+from app_pages import schema as engine
+from app_pages.schema import Schema
+
+# Generic blocks for any category in the schema registry. Housing has its
+# own page with extra features but shares the load/validate/save path and
+# builds its form, hover texts and link columns from these helpers.
+
+# ------------------------ UI Blocks ------------------------
+
+def uploader_block(sch: Schema):
+    uploaded = st.file_uploader(
+        "Upload CSV", type=["csv"], key=f"{sch.key}_uploader",
+        help=f"Upload a CSV file to replace the current {sch.name} data."
+    )
+    if uploaded is not None:
+        try:
+            df, missing, problems = engine.parse_upload(uploaded.getvalue(), sch)
+            if missing:
+                st.error("Uploaded CSV must contain: " + ", ".join(missing))
+                return
+            engine.save(sch, df)
+            st.session_state[f"{sch.key}_upload_notes"] = [
+                f"{col}: {n} invalid values / ungültige Werte" for col, n in problems.items()
+            ]
+            st.session_state.pop(f"{sch.key}_uploader", None)  # clear used stream
+            st.rerun()
+        except Exception as e:
+            st.error(f"Error reading uploaded file: {e}")
+    for note in st.session_state.pop(f"{sch.key}_upload_notes", []):
+        st.warning(note)
+
+def hover_texts(df: pd.DataFrame, columns: list, labels: dict = None) -> list:
+    """One '<br>'-joined 'label: value' string per row, built column-wise."""
+    labels = labels or {}
+    text = pd.Series("Index: " + df.index.astype(str), index=df.index)
+    for col in columns:
+        text = text + "<br>" + labels.get(col, col) + ": " + df[col].astype(str)
+    return text.tolist()
+
+def link_column_config(sch: Schema) -> dict:
+    return {c: st.column_config.LinkColumn(c, display_text="Open") for c in sch.link_columns}
+
+def form_inputs(sch: Schema, prefix: str) -> dict:
+    """One input per non-generated schema column, chosen by its type; returns the values."""
+    values = {}
+    for col in sch.columns:
+        if col in sch.generated:
+            continue
+        kind, label, key = sch.dtypes[col], sch.label(col), f"{prefix}_{col}"
+        if kind is bool:
+            values[col] = st.checkbox(label, key=key)
+        elif kind is int:
+            values[col] = int(st.number_input(label, min_value=0, step=1, key=key))
+        elif kind is float:
+            values[col] = float(st.number_input(label, min_value=0.0, step=0.1, key=key))
+        else:
+            values[col] = st.text_input(label, key=key)
+    return values
+
+def plot_block(sch: Schema):
+    df = engine.load(sch)
+    if df.empty or not sch.axes:
+        st.info("No data to plot. Please add options first.")
+        return
+
+    all_indices = list(df.index)
+    selected = st.multiselect(
+        "Select options to display / Optionen auswählen:",
+        options=all_indices,
+        default=all_indices,
+        format_func=lambda idx: f"{idx}: {df.loc[idx, 'Name']}",
+        key=f"{sch.key}_select",
+    )
+    if not selected:
+        st.info("No options selected.")
+        return
+    df = df.loc[selected]
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        x_axis = st.selectbox("X Axis", sch.axes, index=0, key=f"{sch.key}_x")
+    with col2:
+        y_axis = st.selectbox("Y Axis", sch.axes, index=min(1, len(sch.axes) - 1), key=f"{sch.key}_y")
+    with col3:
+        hue = st.selectbox("Color / Farbe", sch.hue, index=0, key=f"{sch.key}_hue")
+    with col4:
+        bubble_size = st.selectbox("Bubble Size / Blasengröße", sch.size, index=len(sch.size) - 1, key=f"{sch.key}_size")
+
+    marker_color = df[hue].astype(float)
+    marker_size = df[bubble_size].astype(float).fillna(0)
+    marker_size = (marker_size - marker_size.min()) / (marker_size.max() - marker_size.min() + 1e-6) * 40 + 10
+
+    fig = go.Figure(data=go.Scatter(
+        x=df[x_axis],
+        y=df[y_axis],
+        mode="markers",
+        marker=dict(size=marker_size, color=marker_color, showscale=True, colorscale="Viridis"),
+        text=hover_texts(df, [c for c in sch.columns if c not in sch.link_columns], sch.labels),
+        hovertemplate="%{text}<extra></extra>"
+    ))
+    fig.update_layout(
+        title=f"{sch.name}: {y_axis} vs {x_axis} (Size: {bubble_size}, Color: {hue})",
+        xaxis_title=x_axis,
+        yaxis_title=y_axis,
+        height=500
+    )
+    st.plotly_chart(fig, use_container_width=True, key=f"{sch.key}_plot")
+
+    st.markdown("#### Mean's / Mittelwerte")
+    cols = st.columns(len(sch.axes))
+    for col, name in zip(cols, sch.axes):
+        with col:
+            st.metric(label=name, value=f"{df[name].mean():,.2f}")
+
+def editor_block(sch: Schema) -> pd.DataFrame:
+    df = engine.load(sch)
+    edited = st.data_editor(
+        df,
+        num_rows="dynamic",
+        key=f"{sch.key}_editor",
+        column_config=link_column_config(sch),
+        column_order=sch.columns,
+        use_container_width=True,
+        disabled=sch.generated,
+    )
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("Save Changes", key=f"{sch.key}_save"):
+            to_save, _ = engine.coerce(edited, sch)
+            engine.save(sch, to_save)
+            st.success("Changes saved!")
+            st.rerun()
+    with col2:
+        csv_bytes = edited.to_csv(index=False, columns=sch.columns).encode("utf-8")
+        st.download_button(
+            "Download CSV", csv_bytes, file_name=f"{sch.name}.csv", mime="text/csv",
+            key=f"{sch.key}_download"
+        )
+    return edited
+
+def add_sidebar_block(sch: Schema):
+    st.sidebar.markdown("### Add / Hinzufügen")
+    with st.sidebar.form(f"add_{sch.key}_form", clear_on_submit=True):
+        values = form_inputs(sch, f"add_{sch.key}")
+        submitted = st.form_submit_button("Add")
+
+        if submitted:
+            base = engine.load(sch)
+            new = pd.DataFrame([values])
+            for col in sch.generated:
+                new[col] = np.nan
+            base, _ = engine.coerce(pd.concat([base, new], ignore_index=True), sch)
+            engine.save(sch, base)
+            st.sidebar.success(f"New {sch.name} option added!")
+            st.rerun()
+
+# ------------------------ Page ------------------------
+
+def category_page_body(name: str, title: str, intro: str):
+    sch = engine.SCHEMAS[name]
+    st.header(title)
+    st.write(intro)
+    uploader_block(sch)
+    plot_block(sch)
+    st.write("---")
+    st.markdown(f"### View, Edit or Delete your {sch.name} Data:")
+    editor_block(sch)
+    add_sidebar_block(sch)
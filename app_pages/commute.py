@@ -0,0 +1,163 @@
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from app_pages.dedup import normalize_text
+
+# ------------------------ Config ------------------------
+
+GEOCODE_CACHE_PATH = "Data/geocode_cache.json"
+GAZETTEER_PATH = "Data/Gazetteer.csv"   # optional: Adress,Lat,Lon
+POI_PATH = "Data/POI.csv"
+POI_COLUMNS = ["Name", "Adress"]
+
+EARTH_RADIUS_KM = 6371.0088
+NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+
+# ------------------------ Geocoders ------------------------
+# A geocoder is any callable taking a list of addresses and returning
+# {address: (lat, lon) or None}. Unknown addresses map to None.
+
+class GazetteerGeocoder:
+    """Look addresses up in a local CSV (Adress, Lat, Lon)."""
+
+    def __init__(self, path: str = GAZETTEER_PATH) -> None:
+        table = pd.read_csv(path)
+        self.coords = {
+            normalize_text(a): (float(lat), float(lon))
+            for a, lat, lon in zip(table["Adress"], table["Lat"], table["Lon"])
+        }
+
+    def __call__(self, addresses: list) -> dict:
+        return {a: self.coords.get(normalize_text(a)) for a in addresses}
+
+class NominatimGeocoder:
+    """OpenStreetMap Nominatim, one request per address (max 1/s per their policy)."""
+
+    def __init__(self, user_agent: str = "Apartment-Decision-helper", delay: float = 1.0) -> None:
+        import requests  # only needed when geocoding online
+
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = user_agent
+        self.delay = delay
+
+    def __call__(self, addresses: list) -> dict:
+        result = {}
+        for i, address in enumerate(addresses):
+            if i:
+                time.sleep(self.delay)
+            try:
+                resp = self.session.get(
+                    NOMINATIM_URL, params={"q": address, "format": "json", "limit": 1}, timeout=10
+                )
+                resp.raise_for_status()
+                hits = resp.json()
+            except Exception:
+                continue  # leave unresolved, retried on the next run
+            result[address] = (float(hits[0]["lat"]), float(hits[0]["lon"])) if hits else None
+        return result
+
+def default_geocoder():
+    """Local gazetteer when present, otherwise Nominatim."""
+    if os.path.exists(GAZETTEER_PATH):
+        return GazetteerGeocoder(GAZETTEER_PATH)
+    return NominatimGeocoder()
+
+# ------------------------ Cache ------------------------
+
+class GeocodeCache:
+    """Persistent {normalized address: [lat, lon]} JSON file (hits only)."""
+
+    def __init__(self, path: str = GEOCODE_CACHE_PATH) -> None:
+        self.path = path
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+
+    def __contains__(self, key: str) -> bool:
+        return self.entries.get(key) is not None  # old files may hold null misses
+
+    def get(self, key: str):
+        value = self.entries.get(key)
+        return tuple(value) if value is not None else None
+
+    def update(self, values: dict) -> None:
+        if not values:
+            return
+        self.entries.update({k: list(v) for k, v in values.items()})
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+def geocode(addresses, cache: GeocodeCache, geocoder=None, batch_size: int = 50) -> pd.DataFrame:
+    """Lat/Lon for each address (aligned with the input).
+
+    Addresses are normalized and deduplicated first; only those missing
+    from the cache are sent to ``geocoder``, in batches, and the resolved
+    ones of every batch are written back to the cache. Misses are not
+    cached, so they are retried once the geocoder (e.g. the gazetteer)
+    knows them. Without a geocoder only the cache is used.
+    """
+    addresses = pd.Series(addresses)
+    keys = addresses.map(normalize_text)
+    if geocoder is not None:
+        missing = {}
+        for key, raw in zip(keys, addresses):
+            if key and key not in cache and key not in missing:
+                missing[key] = str(raw)
+        todo = list(missing.items())
+        for start in range(0, len(todo), batch_size):
+            batch = todo[start:start + batch_size]
+            found = geocoder([raw for _, raw in batch])
+            cache.update({key: found[raw] for key, raw in batch if found.get(raw) is not None})
+
+    unique = {key: cache.get(key) for key in keys.unique()}
+    coords = keys.map(lambda k: unique.get(k) or (np.nan, np.nan))
+    return pd.DataFrame(coords.tolist(), columns=["Lat", "Lon"], index=addresses.index)
+
+# ------------------------ Distances ------------------------
+
+def haversine_matrix(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Great-circle distances in km between n origins and m targets, shape (n, m)."""
+    lat1, lon1 = np.radians(np.asarray(lat1, float))[:, None], np.radians(np.asarray(lon1, float))[:, None]
+    lat2, lon2 = np.radians(np.asarray(lat2, float))[None, :], np.radians(np.asarray(lon2, float))[None, :]
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+def poi_column(name: str) -> str:
+    return f"km to {name}"
+
+def poi_columns(names) -> list:
+    """Unique column labels, numbering repeated POI names ("gym", "gym (2)")."""
+    seen = {}
+    labels = []
+    for name in names:
+        seen[name] = seen.get(name, 0) + 1
+        labels.append(poi_column(name if seen[name] == 1 else f"{name} ({seen[name]})"))
+    return labels
+
+def load_pois(path: str = POI_PATH) -> pd.DataFrame:
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=POI_COLUMNS)
+    return pd.read_csv(path, dtype=str)
+
+def save_pois(pois: pd.DataFrame, path: str = POI_PATH) -> None:
+    pois[POI_COLUMNS].to_csv(path, index=False)
+
+def commute_distances(df: pd.DataFrame, pois: pd.DataFrame, cache: GeocodeCache, geocoder=None) -> pd.DataFrame:
+    """One "km to <POI>" column per point of interest, aligned with ``df``."""
+    if pois.empty or df.empty:
+        return pd.DataFrame(index=df.index)
+    # one geocoding pass for listings and POIs together
+    both = pd.concat([df["Adress"], pois["Adress"]], ignore_index=True)
+    coords = geocode(both, cache, geocoder)
+    homes, targets = coords.iloc[:len(df)], coords.iloc[len(df):]
+    matrix = haversine_matrix(homes["Lat"], homes["Lon"], targets["Lat"], targets["Lon"])
+    return pd.DataFrame(
+        np.round(matrix, 2), index=df.index, columns=poi_columns(pois["Name"])
+    )
@@ -0,0 +1,255 @@
+import re
+import zlib
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+import numpy as np
+import pandas as pd
+
+# ------------------------ Config ------------------------
+
+NUM_PERM = 64          # MinHash signature length
+BANDS = 8              # LSH bands (NUM_PERM / BANDS rows per band)
+SHINGLE_SIZE = 3       # character n-grams
+TEXT_THRESHOLD = 0.7   # estimated Jaccard needed for a near-duplicate
+ADRESS_THRESHOLD = 0.6 # Jaccard of the address shingles for a near-duplicate
+REL_TOLERANCE = 0.05   # Rent / Size may differ by 5 %
+MAX_BUCKET = 64        # buckets beyond this hold templated text, not duplicates
+
+TEXT_COLUMNS = ["Name", "Adress", "Custom"]
+NUMERIC_COLUMNS = ["Rent", "Size"]
+
+_PRIME = (1 << 61) - 1
+_rng = np.random.default_rng(92)
+_PERM_A = _rng.integers(1, 1 << 31, size=NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.integers(0, 1 << 31, size=NUM_PERM, dtype=np.uint64)
+
+_TRACKING_PARAMS = {"ref", "fbclid", "gclid"}
+_TRACKING_PREFIXES = ("utm_",)
+
+# "Hauptstr.", "Haupt Str" and "Hauptstr 5" all mean "...strasse"
+_STREET_SUFFIX = re.compile(r"str\.|\bstr\b|(?<=\w)str(?=\s+\d)")
+
+# ------------------------ Normalizing ------------------------
+
+def _is_blank(value) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, float) and np.isnan(value):
+        return True
+    s = str(value).strip()
+    return s == "" or s.lower() == "nan"
+
+@lru_cache(maxsize=1 << 17)
+def normalize_text(value) -> str:
+    """Case-fold, spell out "str." street suffixes, drop punctuation and collapse whitespace."""
+    if _is_blank(value):
+        return ""
+    s = _STREET_SUFFIX.sub("strasse", str(value).casefold())  # casefold: ß -> ss
+    s = re.sub(r"[^\w\s]", " ", s)
+    return " ".join(s.split())
+
+def _is_tracking_param(name: str) -> bool:
+    return name in _TRACKING_PARAMS or name.startswith(_TRACKING_PREFIXES)
+
+@lru_cache(maxsize=1 << 17)
+def normalize_link(value) -> str:
+    """Reduce a listing URL to host + path + non-tracking query."""
+    if _is_blank(value):
+        return ""
+    s = str(value).strip()
+    if "//" not in s:
+        s = "//" + s
+    parts = urlsplit(s)
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    path = parts.path.rstrip("/")
+    query = "&".join(sorted(
+        q for q in parts.query.split("&")
+        if q and not _is_tracking_param(q.split("=", 1)[0].lower())
+    ))
+    key = host + path
+    if query:
+        key += "?" + query
+    return key
+
+# ------------------------ MinHash ------------------------
+
+def shingles(text: str, k: int = SHINGLE_SIZE) -> set:
+    if len(text) <= k:
+        return {text} if text else set()
+    return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+def minhash_signature(tokens: set) -> np.ndarray:
+    """MinHash signature of a shingle set (all-max for an empty set)."""
+    if not tokens:
+        return np.full(NUM_PERM, _PRIME, dtype=np.uint64)
+    hashes = np.fromiter(
+        (zlib.crc32(t.encode("utf-8")) for t in tokens),
+        dtype=np.uint64, count=len(tokens),
+    )
+    values = (_PERM_A[:, None] * hashes[None, :] + _PERM_B[:, None]) % _PRIME
+    return values.min(axis=1)
+
+def _house_numbers(adress: str) -> frozenset:
+    return frozenset(re.findall(r"\d+", adress))
+
+def _adress_similar(a: str, b: str) -> bool:
+    """Addresses of a near-duplicate pair: same house numbers, similar street."""
+    if not a or not b:
+        return not a and not b
+    if _house_numbers(a) != _house_numbers(b):
+        return False
+    sa, sb = shingles(a), shingles(b)
+    return len(sa & sb) >= ADRESS_THRESHOLD * len(sa | sb)
+
+def _row_text(row) -> str:
+    return " ".join(normalize_text(row.get(col)) for col in TEXT_COLUMNS).strip()
+
+def _close(a, b, rel_tol: float, missing_matches: bool = True) -> bool:
+    """Numeric proximity; ``missing_matches`` decides how a blank value counts."""
+    if _is_blank(a) or _is_blank(b):
+        return missing_matches
+    a, b = float(a), float(b)
+    return abs(a - b) <= rel_tol * max(abs(a), abs(b), 1.0)
+
+# ------------------------ Index ------------------------
+
+class DuplicateIndex:
+    """Incremental exact + near-duplicate index over housing rows.
+
+    Exact duplicates are looked up in hash maps keyed on the normalized
+    Link and Adress. Near-duplicates go through MinHash/LSH buckets, so a
+    check only compares against the few rows sharing a band, never the
+    whole table. Buckets larger than ``MAX_BUCKET`` come from templated
+    titles and are not used as candidate sources.
+    """
+
+    def __init__(self, threshold: float = TEXT_THRESHOLD, rel_tol: float = REL_TOLERANCE) -> None:
+        self.threshold = threshold
+        self.rel_tol = rel_tol
+        self.rows_per_band = NUM_PERM // BANDS
+        self.by_link = {}       # normalized link -> [row_id]
+        self.by_adress = {}     # normalized adress -> [row_id]
+        self.buckets = {}       # (band, band bytes) -> [row_id]
+        self.signatures = {}    # row_id -> signature
+        self.numbers = {}       # row_id -> {col: value}
+        self.adresses = {}      # row_id -> normalized adress
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, **kwargs) -> "DuplicateIndex":
+        index = cls(**kwargs)
+        for row_id, row in zip(df.index, df.to_dict("records")):
+            index.add(row_id, row)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    def _bands(self, signature: np.ndarray):
+        r = self.rows_per_band
+        for band in range(BANDS):
+            yield band, signature[band * r:(band + 1) * r].tobytes()
+
+    def add(self, row_id, row) -> None:
+        link = normalize_link(row.get("Link"))
+        adress = normalize_text(row.get("Adress"))
+        if link:
+            self.by_link.setdefault(link, []).append(row_id)
+        if adress:
+            self.by_adress.setdefault(adress, []).append(row_id)
+
+        text = _row_text(row)
+        signature = minhash_signature(shingles(text))
+        self.signatures[row_id] = signature
+        self.numbers[row_id] = {col: row.get(col) for col in NUMERIC_COLUMNS}
+        self.adresses[row_id] = adress
+        if text:
+            for key in self._bands(signature):
+                self.buckets.setdefault(key, []).append(row_id)
+
+    def _numbers_close(self, row, row_id, missing_matches: bool = True) -> bool:
+        other = self.numbers[row_id]
+        return all(
+            _close(row.get(col), other[col], self.rel_tol, missing_matches)
+            for col in NUMERIC_COLUMNS
+        )
+
+    def match(self, row) -> list:
+        """Return [(row_id, kind, score)] for rows duplicating ``row``.
+
+        ``kind`` is "link", "adress" or "near"; score is the estimated
+        text similarity (1.0 for exact hits).
+        """
+        found = {}
+        link = normalize_link(row.get("Link"))
+        adress = normalize_text(row.get("Adress"))
+        for row_id in self.by_link.get(link, []) if link else []:
+            found[row_id] = ("link", 1.0)
+        for row_id in self.by_adress.get(adress, []) if adress else []:
+            # same building, different flat: only a hit if Rent/Size agree
+            if row_id not in found and self._numbers_close(row, row_id, missing_matches=False):
+                found[row_id] = ("adress", 1.0)
+
+        text = _row_text(row)
+        if text:
+            signature = minhash_signature(shingles(text))
+            candidates = set()
+            for key in self._bands(signature):
+                bucket = self.buckets.get(key, [])
+                if len(bucket) <= MAX_BUCKET:
+                    candidates.update(bucket)
+            for row_id in candidates - found.keys():
+                score = float(np.mean(self.signatures[row_id] == signature))
+                if score < self.threshold:
+                    continue
+                if _adress_similar(adress, self.adresses[row_id]) and self._numbers_close(row, row_id):
+                    found[row_id] = ("near", score)
+
+        return sorted(
+            ((row_id, kind, score) for row_id, (kind, score) in found.items()),
+            key=lambda m: -m[2],
+        )
+
+# ------------------------ Batch helpers ------------------------
+
+def find_duplicates(df: pd.DataFrame, index: DuplicateIndex = None) -> pd.DataFrame:
+    """Check every row of ``df`` against ``index`` and the rows before it.
+
+    Rows are matched then inserted one at a time, so an import costs
+    O(n) index operations instead of an O(n²) pairwise scan. Returns one
+    line per hit with columns row, duplicate_of, kind, score.
+    """
+    index = index if index is not None else DuplicateIndex()
+    hits = []
+    for row_id, row in zip(df.index, df.to_dict("records")):
+        for other, kind, score in index.match(row):
+            hits.append({"row": row_id, "duplicate_of": other, "kind": kind, "score": score})
+        index.add(row_id, row)
+    return pd.DataFrame(hits, columns=["row", "duplicate_of", "kind", "score"])
+
+def drop_exact_duplicates(df: pd.DataFrame) -> tuple:
+    """Drop rows that share a Link or Adress with an earlier row.
+
+    Returns (cleaned df, near-duplicate report). The report uses the
+    labels of the cleaned df; a hit on a dropped row points at the row
+    it repeated.
+    """
+    report = find_duplicates(df)
+    exact = report[report["kind"] != "near"].drop_duplicates("row")
+    origin = dict(zip(exact["row"], exact["duplicate_of"]))
+    kept = df.index.drop(exact["row"])
+    position = {label: pos for pos, label in enumerate(kept)}
+
+    def kept_label(row_id):
+        while row_id in origin:  # duplicate_of is always an earlier row
+            row_id = origin[row_id]
+        return position[row_id]
+
+    near = report[report["kind"] == "near"].copy()
+    near["row"] = near["row"].map(kept_label)
+    near["duplicate_of"] = near["duplicate_of"].map(kept_label)
+    near = near[near["row"] != near["duplicate_of"]]
+    near = near.drop_duplicates(["row", "duplicate_of"]).reset_index(drop=True)
+    return df.loc[kept].reset_index(drop=True), near
@@ -1,5 +1,7 @@
-import streamlit as st
+from app_pages.category_page import category_page_body
 
 def page_hotels_body(app):
-    st.header("Vacation Homes")
-    st.write("Welcome to the Vacation Homes / Hotels / Airbnb decision page.")
+    category_page_body(
+        "Hotels", "Vacation Homes",
+        "Welcome to the Vacation Homes / Hotels / Airbnb decision page."
+    )
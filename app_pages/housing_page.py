@@ -9,6 +9,8 @@ LANGUAGES = {
         "upload_error": "Uploaded CSV must contain: ",
         "upload_success": "File uploaded and data replaced successfully!",
         "upload_read_error": "Error reading uploaded file",
+        "upload_duplicates": "Dropped {n} duplicate rows (same link or address).",
+        "upload_near_duplicates": "{n} rows look like near-duplicates of other listings: ",
         "hover_info": "Hover over a marker to see all details. Use the table below to open the link or maps.",
         "edit_title": "### View, Edit or Delete your Housing Data:",
         "edit_info": "Use the Add form in the sidebar to add new housing options to ensure functionality.",
@@ -21,6 +23,8 @@ LANGUAGES = {
         "upload_error": "Hochgeladene CSV muss enthalten: ",
         "upload_success": "Datei hochgeladen und Daten erfolgreich ersetzt!",
         "upload_read_error": "Fehler beim Lesen der hochgeladenen Datei",
+        "upload_duplicates": "{n} doppelte Zeilen entfernt (gleicher Link oder gleiche Adresse).",
+        "upload_near_duplicates": "{n} Zeilen ähneln stark anderen Einträgen: ",
         "hover_info": "Fahren Sie mit der Maus über einen Marker, um alle Details zu sehen. Verwenden Sie die Tabelle unten, um den Link oder die Karte zu öffnen.",
         "edit_title": "### Wohnungsdaten anzeigen, bearbeiten oder löschen:",
         "edit_info": "Verwenden Sie das Hinzufügen-Formular in der Seitenleiste, um neue Wohnungsoptionen hinzuzufügen.",
@@ -28,32 +32,38 @@ LANGUAGES = {
 }
 import streamlit as st
 import pandas as pd
-import io
 from urllib.parse import quote_plus
 import plotly.graph_objects as go
 
+from app_pages import schema
+from app_pages.schema import SCHEMAS
+from app_pages.category_page import form_inputs, hover_texts, link_column_config
+from app_pages.dedup import DuplicateIndex, drop_exact_duplicates
+from app_pages.search import SearchIndex
+from app_pages.similarity import SimilarListings, rent_per_sqm
+from app_pages.commute import (
+    GeocodeCache, commute_distances, default_geocoder, load_pois, save_pois, POI_COLUMNS
+)
+from app_pages.price_history import PriceHistory, HISTORY_DIR
+from app_pages.link_check import (
+    LinkCache, LinkCheckJob, link_status,
+    STATUS_OK, STATUS_DEAD, STATUS_ERROR, STATUS_UNCHECKED
+)
+
 # ------------------------ Config ------------------------
 
-CSV_PATH = "Data/Housing.csv"
-EXPECTED_COLUMNS = [
-    "Name", "Link", "Adress", "Rent", "Distance", "Rooms", "Size",
-    "Kitchen", "Furnished", "Rental Period", "Parking", "Custom"
-]
+# Columns and types live in the schema registry (app_pages/schema.py)
+HOUSING = SCHEMAS["Housing"]
+CSV_PATH = HOUSING.path
+EXPECTED_COLUMNS = HOUSING.columns
 
-DTYPES = {
-    "Name": str,
-    "Link": str,
-    "Adress": str,  # CSV uses 'Adress'
-    "Rent": int,
-    "Distance": float,
-    "Rooms": float,
-    "Size": float,
-    "Kitchen": bool,
-    "Furnished": bool,
-    "Rental Period": str,
-    "Parking": bool,
-    "Custom": str,
-}
+GENERATED_COLUMNS = ["Adress_Link", "Link Status"]  # shown in the editor, never saved
+# editor shows each generated column right after the one it is derived from
+EDITOR_COLUMNS = [
+    c for col in HOUSING.columns
+    for c in (col, {"Link": "Link Status", "Adress": "Adress_Link"}.get(col)) if c
+]
+LINK_STATUSES = [STATUS_OK, STATUS_DEAD, STATUS_ERROR, STATUS_UNCHECKED]
 
 # ------------------------ Helpers ------------------------
 
@@ -72,19 +82,106 @@ def add_maps_link_column(df: pd.DataFrame) -> pd.DataFrame:
     df["Adress_Link"] = df["Adress"].apply(maps_place_url)
     return df
 
-def validate_columns(df: pd.DataFrame) -> bool:
-    return all(col in df.columns for col in EXPECTED_COLUMNS)
+def add_link_status_column(df: pd.DataFrame) -> pd.DataFrame:
+    """Add/refresh the last known link-check status."""
+    df = df.copy()
+    df["Link Status"] = link_status(df["Link"], LinkCache()).to_numpy()
+    return df
 
 def load_housing(path: str = CSV_PATH) -> pd.DataFrame:
-    return pd.read_csv(path, dtype=DTYPES)
+    return schema.load(HOUSING, path)
 
 def save_housing(df: pd.DataFrame, path: str = CSV_PATH) -> None:
-    df.to_csv(path, index=False)
-
-def parse_uploaded_csv(uploaded_file) -> pd.DataFrame:
-    """Read uploaded CSV from a fresh BytesIO stream."""
-    data = uploaded_file.getvalue()
-    return pd.read_csv(io.BytesIO(data))
+    schema.save(HOUSING, df, path)
+    if path == CSV_PATH:
+        get_price_history().record(df)
+
+def dataset_version(path: str = CSV_PATH) -> tuple:
+    return schema.dataset_version(path)
+
+@st.cache_resource
+def _index_store(kind: str, path: str) -> dict:
+    """Process-wide holder for an in-memory index over the CSV at ``path``."""
+    return {"version": None, "index": None}
+
+def get_price_history() -> PriceHistory:
+    """Shared history store (keeps its latest-value state between saves)."""
+    store = _index_store("history", HISTORY_DIR)
+    if store["index"] is None:
+        store["index"] = PriceHistory(HISTORY_DIR)
+    return store["index"]
+
+def get_duplicate_index(path: str = CSV_PATH) -> DuplicateIndex:
+    """Duplicate index for the CSV, rebuilt only when the file changed."""
+    store = _index_store("duplicates", path)
+    version = dataset_version(path)
+    if store["version"] != version:
+        store["index"] = DuplicateIndex.from_frame(load_housing(path))
+        store["version"] = version
+    return store["index"]
+
+def add_to_duplicate_index(row_id, row, path: str = CSV_PATH) -> None:
+    """Insert a freshly saved row instead of rebuilding the whole index."""
+    store = _index_store("duplicates", path)
+    if store["index"] is not None:
+        store["index"].add(row_id, row)
+        store["version"] = dataset_version(path)
+
+def get_search_index(df: pd.DataFrame = None, path: str = CSV_PATH) -> SearchIndex:
+    """Full-text index for the CSV, synced row-wise after edits and uploads."""
+    store = _index_store("search", path)
+    if store["index"] is None:
+        store["index"] = SearchIndex()
+    version = dataset_version(path)
+    if store["version"] != version:
+        store["index"].sync(load_housing(path) if df is None else df)
+        store["version"] = version
+    return store["index"]
+
+def add_to_search_index(row_id, row, previous: tuple, path: str = CSV_PATH) -> None:
+    """Index a freshly saved row; ``previous`` is the file version before the save.
+
+    Only an index that was current before the save is patched, a stale one
+    is left for the next ``sync``.
+    """
+    store = _index_store("search", path)
+    if store["index"] is not None and store["version"] == previous:
+        store["index"].add(row_id, row)
+        store["version"] = dataset_version(path)
+
+def get_similar_listings(df: pd.DataFrame, path: str = CSV_PATH) -> SimilarListings:
+    """k-d tree lookup for the CSV, rebuilt lazily when the file changed."""
+    store = _index_store("similar", path)
+    version = dataset_version(path)
+    if store["version"] != version:
+        store["index"] = SimilarListings(df)
+        store["version"] = version
+    return store["index"]
+
+def search_rows(df: pd.DataFrame, query: str, statuses=None) -> list:
+    """Index labels of ``df`` matching the search box query and link-status filter."""
+    if not query or not query.strip():
+        rows = list(df.index)
+    else:
+        rows = [idx for idx in get_search_index(df).search(query) if idx in df.index]
+    if statuses:
+        status = link_status(df["Link"], LinkCache())
+        keep = set(df.index[status.isin(statuses).to_numpy()])
+        rows = [idx for idx in rows if idx in keep]
+    return rows
+
+def merge_edited(base: pd.DataFrame, edited: pd.DataFrame, shown_index) -> pd.DataFrame:
+    """Write an editor view over a subset of ``base`` back into ``base``.
+
+    Rows of ``shown_index`` missing from ``edited`` were deleted, rows
+    with unknown labels were added in the editor and go to the end.
+    """
+    shown = pd.Index(shown_index)
+    kept = base.drop(index=shown.intersection(base.index))
+    existing = edited[edited.index.isin(shown)]
+    added = edited[~edited.index.isin(shown)]
+    merged = pd.concat([kept, existing]).sort_index()
+    return pd.concat([merged, added], ignore_index=True)
 
 # ------------------------ UI Blocks ------------------------
 
@@ -95,54 +192,66 @@ def uploader_block(texts):
     )
     if uploaded is not None:
         try:
-            up_df = parse_uploaded_csv(uploaded)
-            if not validate_columns(up_df):
+            up_df, missing, problems = schema.parse_upload(uploaded.getvalue(), HOUSING)
+            if missing:
                 st.error(texts["upload_error"] + ", ".join(EXPECTED_COLUMNS))
                 return
-            up_df = up_df[EXPECTED_COLUMNS]
+            n_rows = len(up_df)
+            up_df, near = drop_exact_duplicates(up_df)
             save_housing(up_df)
             st.success(texts["upload_success"])
+            n_exact = n_rows - len(up_df)
+            notes = [f"{col}: {n} invalid values / ungültige Werte" for col, n in problems.items()]
+            if n_exact:
+                notes.append(texts["upload_duplicates"].format(n=n_exact))
+            if not near.empty:
+                pairs = ", ".join(f"{r} ~ {d}" for r, d in zip(near["row"], near["duplicate_of"]))
+                notes.append(texts["upload_near_duplicates"].format(n=near["row"].nunique()) + pairs)
+            st.session_state["housing_upload_notes"] = notes
             st.session_state.pop("housing_uploader", None)  # clear used stream
             st.rerun()
         except Exception as e:
             st.error(f"{texts['upload_read_error']}: {e}")
+    for note in st.session_state.pop("housing_upload_notes", []):
+        st.warning(note)
 
 def editor_block(df: pd.DataFrame) -> pd.DataFrame:
     """Render editor (with clickable link column). Return edited df."""
-    df_with_links = add_maps_link_column(df)
+    df_with_links = add_link_status_column(add_maps_link_column(df))
 
     edited = st.data_editor(
         df_with_links,
         num_rows="dynamic",
         key="housing_editor",
         column_config={
-            "Link": st.column_config.LinkColumn("Link", display_text="Open"),
+            **link_column_config(HOUSING),
+            "Link Status": st.column_config.TextColumn("Link Status"),
             "Adress": st.column_config.TextColumn("Adress"),
             "Adress_Link": st.column_config.LinkColumn("Adress (Maps)", display_text="Open in Maps"),
         },
-        column_order=[
-            "Name", "Link", "Adress", "Adress_Link", "Rent", "Distance", "Rooms", "Size",
-            "Kitchen", "Furnished", "Rental Period", "Parking", "Custom"
-        ],
+        column_order=EDITOR_COLUMNS,
         use_container_width=True,
-        disabled=["Adress_Link"],  # generated column
+        disabled=GENERATED_COLUMNS,
     )
 
     # refresh generated column after edits
     edited["Adress_Link"] = edited["Adress"].apply(maps_place_url)
     return edited
 
-def actions_block(edited: pd.DataFrame):
+def actions_block(edited: pd.DataFrame, base: pd.DataFrame = None, shown=None):
+    """Save/download buttons; ``base``/``shown`` are set when the editor is filtered."""
     col1, col2 = st.columns(2)
     with col1:
         if st.button("Save Changes"):
-            to_save = edited.drop(columns=["Adress_Link"], errors="ignore")
+            to_save = edited.drop(columns=GENERATED_COLUMNS, errors="ignore")
+            if base is not None:
+                to_save = merge_edited(base, to_save, shown)
             save_housing(to_save)
             st.success("Changes saved!")
             st.rerun()
     with col2:
         # Download what is currently shown (without generated column)
-        to_download = edited.drop(columns=["Adress_Link"], errors="ignore")
+        to_download = edited.drop(columns=GENERATED_COLUMNS, errors="ignore")
         csv_bytes = to_download.to_csv(index=False).encode("utf-8")
         st.download_button("Download CSV", csv_bytes, file_name="Housing.csv", mime="text/csv")
 
@@ -150,52 +259,40 @@ def add_sidebar_block():
     st.sidebar.markdown("### Add / Hinzufügen")
     if "add_form_submitted" not in st.session_state:
         st.session_state["add_form_submitted"] = False
+    near = st.session_state.pop("add_near_duplicates", None)
+    if near:
+        st.sidebar.warning(
+            "Looks similar to / Ähnelt: " + ", ".join(f"#{row_id}" for row_id in near)
+        )
 
     with st.sidebar.form("add_housing_form", clear_on_submit=True):
-        name = st.text_input("Name", key="add_name")
-        link = st.text_input("Link", key="add_link")
-        adress = st.text_input("Adress", key="add_adress")
-        rent = st.number_input("Rent / Miete", min_value=0, step=1, key="add_rent")
-        distance = st.number_input("Distance", min_value=0.0, step=0.1, key="add_distance")
-        rooms = st.number_input("Rooms / Räume", min_value=0.0, step=0.5, key="add_rooms")
-        size = st.number_input("Size / Größe", min_value=0.0, step=0.1, key="add_size")
-        kitchen = st.checkbox("Kitchen / Küche", key="add_kitchen")
-        furnished = st.checkbox("Furnished / Möbliert", key="add_furnished")
-        rental_period = st.text_input("Rental Period / Mietzeitraum", key="add_rental_period")
-        parking = st.checkbox("Parking / Parkplatz", key="add_parking")
-        custom = st.text_input("Custom / Notizen", key="add_custom")
+        new_row = form_inputs(HOUSING, "add")
         submitted = st.form_submit_button("Add")
 
         if submitted:
-            new_row = {
-                "Name": name,
-                "Link": link,
-                "Adress": adress,
-                "Rent": int(rent),
-                "Distance": float(distance),
-                "Rooms": float(rooms),
-                "Size": float(size),
-                "Kitchen": kitchen,
-                "Furnished": furnished,
-                "Rental Period": rental_period,
-                "Parking": parking,
-                "Custom": custom,
-            }
-            base = load_housing()
-            base = pd.concat([base, pd.DataFrame([new_row])], ignore_index=True)
-            save_housing(base)
-            st.session_state["add_form_submitted"] = True
-            st.sidebar.success("New housing option added!")
-            st.rerun()
+            matches = get_duplicate_index().match(new_row)
+            exact = [m for m in matches if m[1] != "near"]
+            if exact:
+                st.sidebar.error(
+                    "Already listed / Bereits vorhanden: "
+                    + ", ".join(f"#{row_id}" for row_id, _, _ in exact)
+                )
+            else:
+                previous = dataset_version()
+                base = load_housing()
+                base = pd.concat([base, pd.DataFrame([new_row])], ignore_index=True)
+                save_housing(base)
+                add_to_duplicate_index(len(base) - 1, new_row)
+                add_to_search_index(len(base) - 1, new_row, previous)
+                if matches:
+                    st.session_state["add_near_duplicates"] = [row_id for row_id, _, _ in matches]
+                st.session_state["add_form_submitted"] = True
+                st.sidebar.success("New housing option added!")
+                st.rerun()
     # After rerun, clear the form fields
     if st.session_state.get("add_form_submitted", False):
-        for key in [
-            "add_name", "add_link", "add_adress", "add_rent", "add_distance",
-            "add_rooms", "add_size", "add_kitchen", "add_furnished",
-            "add_rental_period", "add_parking", "add_custom"
-        ]:
-            if key in st.session_state:
-                del st.session_state[key]
+        for col in HOUSING.columns:
+            st.session_state.pop(f"add_{col}", None)
         st.session_state["add_form_submitted"] = False
 
 def plotly_block():
@@ -204,8 +301,19 @@ def plotly_block():
         st.info("No data to plot. Please add housing options first.")
         return
 
+    query = st.text_input(
+        "Search / Suchen", key="housing_search",
+        placeholder="Name, Adress, Rental Period, Custom ..."
+    )
+    statuses = st.multiselect(
+        "Link status / Link-Status", LINK_STATUSES, key="housing_link_filter",
+        help="Empty = all listings. Run 'Check links' below to refresh."
+    )
     # Multi-select for which rows to display
-    all_indices = list(df.index)
+    all_indices = search_rows(df, query, statuses)
+    if not all_indices:
+        st.info("No listings match the search. / Keine passenden Einträge.")
+        return
     selected_indices = st.multiselect(
         "Select housing options to display / Wählen Sie Wohnungsoptionen aus:", 
         options=all_indices, 
@@ -215,11 +323,14 @@ def plotly_block():
     if not selected_indices:
         st.info("No options selected.")
         return
-    df = df.loc[selected_indices].reset_index(drop=True)
+    full = df
+    commute = commute_distances(df, load_pois(), GeocodeCache())
+    poi_cols = list(commute.columns)
+    df = add_link_status_column(df.join(commute)).loc[selected_indices].reset_index(drop=True)
 
-    axis_options = ["Distance", "Rent", "Rooms", "Size"]
-    hue_options = ["Rooms", "Distance", "Size", "Kitchen", "Furnished", "Parking"]
-    size_options = ["Rent", "Distance", "Rooms","Size"]
+    axis_options = HOUSING.axes + poi_cols
+    hue_options = HOUSING.hue + poi_cols
+    size_options = HOUSING.size + poi_cols
 
     col1, col2, col3, col4 = st.columns(4)
     with col1:
@@ -232,24 +343,11 @@ def plotly_block():
         bubble_size = st.selectbox("Bubble Size / Blasengröße", size_options, index=3)
 
     # Prepare hover text with all info for each point
-    hover_text = [
-        "<br>".join([
-            f"Index: {row.name}",
-            f"Name: {row['Name']}",
-            f"Adress: {row['Adress']}",
-            f"Rent / Miete: {row['Rent']}",
-            f"Distance: {row['Distance']}",
-            f"Rooms: {row['Rooms']}",
-            f"Size / Größe: {row['Size']}",
-            f"Kitchen / Küche: {row['Kitchen']}",
-            f"Furnished / Möbliert: {row['Furnished']}",
-            f"Rental Period / Mietdauer: {row['Rental Period']}",
-            f"Parking: {row['Parking']}",
-            f"Custom / Notizen: {row['Custom']}",
-            f"Rent/Size / Quadratmeterpreis: {row['Rent'] / row['Size'] if row['Size'] > 0 else 0:.2f} €/m²"
-        ])
-        for _, row in df.iterrows()
-    ]
+    per_sqm = "Rent/Size / Quadratmeterpreis"
+    hover = df.assign(**{per_sqm: rent_per_sqm(df).map("{:.2f} €/m²".format)})
+    hover_columns = [c for c in HOUSING.columns if c not in HOUSING.link_columns]
+    hover_columns.insert(1, "Link Status")
+    hover_text = hover_texts(hover, hover_columns + [per_sqm] + poi_cols, HOUSING.labels)
 
     # Handle boolean columns for color/hue
     marker_color = df[hue]
@@ -287,7 +385,11 @@ def plotly_block():
 
     # Show metrics above the plot, under selection options
 
-    st.plotly_chart(fig, use_container_width=True, key="housing_plot")
+    event = st.plotly_chart(
+        fig, use_container_width=True, key="housing_plot",
+        on_select="rerun", selection_mode="points"
+    )
+    picked = [selected_indices[p["point_index"]] for p in event.selection.points]
 
     st.markdown("#### Mean's / Mittelwerte")
     col_metrics = st.columns(4)
@@ -317,6 +419,103 @@ def plotly_block():
             value=f"{mean_distance:,.2f} km"
         )
 
+    price_history_block(full, selected_indices)
+    similar_block(full, picked)
+
+def poi_block():
+    """Edit points of interest and geocode missing addresses on demand."""
+    with st.expander("Points of interest / Wichtige Orte (work, school, gym ...)"):
+        pois = st.data_editor(
+            load_pois(), num_rows="dynamic", key="poi_editor",
+            column_order=POI_COLUMNS, use_container_width=True,
+        )
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("Save POIs / Orte speichern"):
+                pois = pois.dropna(subset=["Name", "Adress"])
+                dupes = pois.loc[pois["Name"].duplicated(), "Name"].unique()
+                if len(dupes):
+                    st.error("POI names must be unique / Namen doppelt: " + ", ".join(dupes))
+                else:
+                    save_pois(pois)
+                    st.rerun()
+        with col2:
+            if st.button("Geocode addresses / Adressen auflösen"):
+                with st.spinner("Geocoding ..."):
+                    # resolves only addresses not yet in the on-disk cache
+                    commute_distances(load_housing(), load_pois(), GeocodeCache(), default_geocoder())
+                st.rerun()
+
+@st.cache_resource
+def _link_check_job() -> LinkCheckJob:
+    return LinkCheckJob()
+
+def link_check_block():
+    """Start the background link check; its progress is polled only while it runs."""
+    job = _link_check_job()
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        if st.button("Check links / Links prüfen", disabled=job.running):
+            job.start(load_housing()["Link"].dropna())
+    with col2:
+        if job.running:
+            link_check_progress()
+        elif job.error is not None:
+            st.caption(f"Link check failed: {job.error}")
+        elif job.finished:
+            st.caption(f"Last link check finished {pd.Timestamp(job.finished, unit='s'):%Y-%m-%d %H:%M} UTC.")
+
+@st.fragment(run_every=2)
+def link_check_progress():
+    """Rendered only while a check runs, so idle sessions never poll."""
+    if _link_check_job().running:
+        st.caption("Checking links in the background ... / Links werden geprüft ...")
+    else:
+        st.rerun()  # refresh plot/editor with the new statuses; ends the polling
+
+def price_history_block(df: pd.DataFrame, row_ids: list):
+    """Rent over time for the listings shown in the plot."""
+    history = get_price_history().series(df, row_ids, "Rent")
+    if history.empty:
+        return
+    st.markdown("#### Rent over time / Miete im Zeitverlauf")
+    fig = go.Figure()
+    for row_id, part in history.groupby("row", sort=False):
+        # extend the last known price to today so flat listings stay visible
+        ts = list(part["ts"]) + [pd.Timestamp.now(tz="UTC").tz_localize(None)]
+        values = list(part["value"]) + [part["value"].iloc[-1]]
+        fig.add_trace(go.Scatter(
+            x=ts, y=values, mode="lines+markers", line_shape="hv",
+            name=f"{row_id}: {df.loc[row_id, 'Name']}"
+        ))
+    fig.update_layout(xaxis_title="Date", yaxis_title="Rent / Miete", height=350)
+    st.plotly_chart(fig, use_container_width=True, key="housing_price_history")
+
+def similar_block(df: pd.DataFrame, picked: list):
+    """Show the k most similar listings for the points picked in the plot."""
+    st.markdown("#### Similar listings / Ähnliche Wohnungen")
+    cols = st.columns([3, 1])
+    with cols[0]:
+        targets = st.multiselect(
+            "Click markers or choose listings / Marker anklicken oder auswählen:",
+            options=list(df.index),
+            default=picked,
+            format_func=lambda idx: f"{idx}: {df.loc[idx, 'Name']}",
+            key=f"housing_similar_{'-'.join(map(str, picked))}",
+        )
+    with cols[1]:
+        k = st.number_input("k", min_value=1, max_value=max(1, len(df) - 1), value=min(3, max(1, len(df) - 1)))
+    if not targets:
+        return
+    neighbours = get_similar_listings(df).query(targets, int(k))
+    for target in targets:
+        rows = neighbours.get(target, [])
+        if not rows:
+            continue
+        table = df.loc[[row_id for row_id, _ in rows], ["Name", "Adress", "Rent", "Distance", "Rooms", "Size"]]
+        table.insert(0, "Similarity distance", [round(d, 3) for _, d in rows])
+        st.caption(f"{target}: {df.loc[target, 'Name']}")
+        st.dataframe(table, use_container_width=True)
 
 
 # ------------------------ Page ------------------------
@@ -346,6 +545,8 @@ def page_housing_body(app):
             st.markdown("<span style='color:#4CAF50;font-weight:bold;'>DE</span>", unsafe_allow_html=True)
 
     
+    poi_block()
+    link_check_block()
     plotly_block()
     st.info(texts["hover_info"])
 
@@ -355,6 +556,13 @@ def page_housing_body(app):
 
     
     df = load_housing()
-    edited = editor_block(df)
-    actions_block(edited)
+    query = st.session_state.get("housing_search", "")
+    statuses = st.session_state.get("housing_link_filter", [])
+    shown = search_rows(df, query, statuses)
+    if len(shown) == len(df):
+        edited = editor_block(df)
+        actions_block(edited)
+    else:
+        edited = editor_block(df.loc[shown])
+        actions_block(edited, base=df, shown=shown)
     add_sidebar_block()
@@ -0,0 +1,153 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+import pandas as pd
+
+# ------------------------ Config ------------------------
+
+LINK_CACHE_PATH = "Data/link_cache.json"
+PER_HOST_LIMIT = 2       # parallel requests per host
+TOTAL_LIMIT = 16         # parallel requests overall (= connection pool size)
+TIMEOUT = 10
+
+STATUS_OK = "ok"
+STATUS_DEAD = "dead"
+STATUS_ERROR = "error"
+STATUS_UNCHECKED = "unchecked"
+
+# ------------------------ Cache ------------------------
+
+class LinkCache:
+    """On-disk {url: {status, code, etag, last_modified, checked}} store."""
+
+    def __init__(self, path: str = LINK_CACHE_PATH) -> None:
+        self.path = path
+        self.entries = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+
+    def get(self, url: str) -> dict:
+        return self.entries.get(url, {})
+
+    def put(self, url: str, entry: dict) -> None:
+        with self._lock:
+            self.entries[url] = entry
+
+    def save(self) -> None:
+        with self._lock:
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f)
+            os.replace(tmp, self.path)
+
+def link_status(links, cache: LinkCache) -> pd.Series:
+    """Last known status per link (aligned with ``links``)."""
+    links = pd.Series(links)
+    return links.map(lambda url: cache.get(str(url)).get("status", STATUS_UNCHECKED))
+
+# ------------------------ Checking ------------------------
+
+def _classify(code: int) -> str:
+    if code in (404, 410):
+        return STATUS_DEAD
+    if code < 400 or code in (401, 403, 405, 429):
+        return STATUS_OK  # reachable, the portal just refuses bots / HEAD
+    return STATUS_ERROR
+
+def _check_one(session, url: str, cached: dict) -> dict:
+    """Conditional GET; a 304 keeps the cached status."""
+    headers = {}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+    try:
+        resp = session.get(url, headers=headers, timeout=TIMEOUT, allow_redirects=True, stream=True)
+        resp.close()  # status + headers are enough, skip the body
+    except Exception as e:
+        # no validators: the next check must fetch fresh instead of trusting a 304
+        return {"status": STATUS_ERROR, "code": None, "error": str(e), "checked": time.time()}
+    if resp.status_code == 304 and cached.get("status"):
+        return {**cached, "code": 304, "checked": time.time()}
+    return {
+        "status": _classify(resp.status_code),
+        "code": resp.status_code,
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+        "checked": time.time(),
+    }
+
+def make_session(pool_size: int = TOTAL_LIMIT):
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = "Apartment-Decision-helper link check"
+    return session
+
+async def check_links(urls, cache: LinkCache, session=None,
+                      per_host: int = PER_HOST_LIMIT, total: int = TOTAL_LIMIT) -> dict:
+    """Check every distinct http(s) URL; returns {url: entry} and fills ``cache``.
+
+    Requests run in worker threads on one pooled session; a global and a
+    per-host semaphore bound how many are in flight at once.
+    """
+    session = session or make_session(total)
+    overall = asyncio.Semaphore(total)
+    hosts = {}
+    urls = [u for u in dict.fromkeys(map(str, urls)) if urlsplit(u).scheme in ("http", "https")]
+
+    async def run(url: str):
+        host = urlsplit(url).netloc.lower()
+        sem = hosts.setdefault(host, asyncio.Semaphore(per_host))
+        async with sem, overall:
+            entry = await asyncio.to_thread(_check_one, session, url, cache.get(url))
+        cache.put(url, entry)
+        return url, entry
+
+    results = dict(await asyncio.gather(*(run(u) for u in urls)))
+    cache.save()
+    return results
+
+# ------------------------ Background job ------------------------
+
+class LinkCheckJob:
+    """Runs ``check_links`` on a daemon thread so a Streamlit rerun never waits."""
+
+    def __init__(self) -> None:
+        self.thread = None
+        self.started = None
+        self.finished = None
+        self.error = None
+
+    @property
+    def running(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self, urls, cache_path: str = LINK_CACHE_PATH, **kwargs) -> bool:
+        """Start a check unless one is already running; returns whether it started."""
+        if self.running:
+            return False
+        urls = list(urls)
+        self.started, self.finished, self.error = time.time(), None, None
+
+        def target():
+            try:
+                asyncio.run(check_links(urls, LinkCache(cache_path), **kwargs))
+            except Exception as e:
+                self.error = e
+            finally:
+                self.finished = time.time()
+
+        self.thread = threading.Thread(target=target, name="link-check", daemon=True)
+        self.thread.start()
+        return True
@@ -0,0 +1,147 @@
+import glob
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from app_pages.dedup import normalize_link, normalize_text
+
+# ------------------------ Config ------------------------
+
+HISTORY_DIR = "Data/price_history"
+HISTORY_COLUMNS = ["Rent"]
+MAX_SEGMENTS = 64   # merge small segment files beyond this many
+
+# ------------------------ Helpers ------------------------
+
+def listing_keys(df: pd.DataFrame) -> pd.Series:
+    """Stable key per listing: normalized Link, else Name + Adress.
+
+    Row positions shift whenever a row is deleted, so history is keyed on
+    the listing itself; the row id at snapshot time is stored alongside.
+    """
+    keys = df["Link"].map(normalize_link)
+    empty = keys == ""
+    if empty.any():
+        rest = df.loc[empty]
+        keys[empty] = "name:" + rest["Name"].map(normalize_text) + "|" + rest["Adress"].map(normalize_text)
+    return keys
+
+# ------------------------ Store ------------------------
+
+class PriceHistory:
+    """Append-only history of tracked columns as Parquet delta segments.
+
+    Every ``record`` call writes one segment holding only the listings
+    whose tracked values changed since their last entry (unchanged cells
+    are null), so daily snapshots of a stable catalog cost next to
+    nothing. A value that turns blank is not recorded, the last known one
+    stands. Segments are only ever added; ``compact`` merges them into
+    one file without dropping records.
+    """
+
+    def __init__(self, path: str = HISTORY_DIR, columns: list = None) -> None:
+        self.path = path
+        self.columns = list(HISTORY_COLUMNS if columns is None else columns)
+        self._latest = None   # key -> last known values, loaded lazily
+
+    def segments(self) -> list:
+        return sorted(glob.glob(os.path.join(self.path, "part-*.parquet")))
+
+    def read(self, keys=None) -> pd.DataFrame:
+        """All history rows (optionally for some keys), sorted by time."""
+        files = self.segments()
+        cols = ["ts", "row_id", "key"] + self.columns
+        if not files:
+            return pd.DataFrame(columns=cols)
+        filters = [("key", "in", list(keys))] if keys is not None else None
+        frames = [pd.read_parquet(f, columns=cols, filters=filters) for f in files]
+        out = pd.concat(frames, ignore_index=True)
+        out["key"] = out["key"].astype(str)
+        return out.sort_values("ts", kind="stable", ignore_index=True)
+
+    def latest(self) -> pd.DataFrame:
+        """Last known value of each tracked column per key."""
+        if self._latest is None:
+            hist = self.read()
+            if hist.empty:
+                self._latest = pd.DataFrame(columns=self.columns, index=pd.Index([], name="key"))
+            else:
+                self._latest = hist.groupby("key")[self.columns].last()
+        return self._latest
+
+    def record(self, df: pd.DataFrame, ts=None) -> int:
+        """Append the changes in ``df`` since the last snapshot; returns rows written."""
+        if df.empty:
+            return 0
+        ts = pd.Timestamp.now(tz="UTC") if ts is None else pd.Timestamp(ts)
+        if ts.tzinfo is not None:
+            ts = ts.tz_convert("UTC").tz_localize(None)
+        current = pd.DataFrame({
+            "row_id": np.arange(len(df), dtype=np.int32),
+            "key": listing_keys(df).to_numpy(),
+        })
+        for col in self.columns:
+            current[col] = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=float)
+        current = current.drop_duplicates("key", keep="last").set_index("key")
+
+        previous = self.latest().reindex(current.index)
+        changed = {}
+        for col in self.columns:
+            now, before = current[col], previous[col].astype(float)
+            # a blank value is "unknown", not a change: null already means unchanged
+            changed[col] = (now != before) & now.notna()
+        mask = pd.DataFrame(changed).any(axis=1)
+        if not mask.any():
+            return 0
+
+        delta = current[mask].copy()
+        for col in self.columns:
+            delta[col] = delta[col].where(changed[col][mask])
+        delta = delta.reset_index()
+        delta.insert(0, "ts", ts.floor("s"))
+        delta["ts"] = delta["ts"].astype("datetime64[s]")
+        delta["key"] = delta["key"].astype("category")
+
+        os.makedirs(self.path, exist_ok=True)
+        name = f"part-{time.time_ns()}.parquet"
+        delta.to_parquet(os.path.join(self.path, name), index=False, compression="zstd")
+
+        # keep the cached latest state in step instead of re-reading
+        latest = self.latest()
+        update = delta.set_index(delta["key"].astype(str))[self.columns]
+        self._latest = update.combine_first(latest) if not latest.empty else update
+        if len(self.segments()) > MAX_SEGMENTS:
+            self.compact()
+        return len(delta)
+
+    def compact(self) -> None:
+        """Merge all segments into one file (records are kept as they are)."""
+        files = self.segments()
+        if len(files) < 2:
+            return
+        merged = self.read()
+        merged["ts"] = merged["ts"].astype("datetime64[s]")
+        merged["key"] = merged["key"].astype("category")
+        target = os.path.join(self.path, "part-0-compacted.parquet")
+        tmp = target + ".tmp"
+        merged.to_parquet(tmp, index=False, compression="zstd")
+        # swap the merged file in first so a failure below only leaves
+        # duplicate segments behind, never lost ones
+        os.replace(tmp, target)
+        for f in files:
+            if os.path.abspath(f) != os.path.abspath(target):
+                os.remove(f)
+
+    def series(self, df: pd.DataFrame, row_ids, column: str = "Rent") -> pd.DataFrame:
+        """Time series of ``column`` for rows of ``df``: columns ts, row, value."""
+        keys = listing_keys(df.loc[list(row_ids)])
+        by_key = {k: r for r, k in keys.items()}
+        hist = self.read(keys=list(by_key))
+        hist = hist.dropna(subset=[column])
+        return pd.DataFrame({
+            "ts": hist["ts"].to_numpy(),
+            "row": hist["key"].map(by_key).to_numpy(),
+            "value": hist[column].to_numpy(),
+        })
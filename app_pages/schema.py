@@ -0,0 +1,217 @@
+import io
+import os
+
+import numpy as np
+import pandas as pd
+
+# ------------------------ Schema ------------------------
+
+class Schema:
+    """Column layout and UI hints of one category CSV.
+
+    ``dtypes`` is ordered and defines the CSV columns; ``axes``, ``hue``
+    and ``size`` are the columns offered in the plot, ``generated``
+    columns are filled in automatically instead of asked for in forms.
+    ``labels`` are optional display names for forms and hover texts.
+    """
+
+    def __init__(self, name: str, path: str, dtypes: dict, axes: list, hue: list = None,
+                 size: list = None, link_columns: list = None, generated: list = None,
+                 labels: dict = None) -> None:
+        self.name = name
+        self.path = path
+        self.dtypes = dtypes
+        self.axes = axes
+        self.hue = hue if hue is not None else axes + self.bool_columns
+        self.size = size if size is not None else axes
+        self.link_columns = link_columns if link_columns is not None else ["Link"]
+        self.generated = generated or []
+        self.labels = labels or {}
+
+    @property
+    def columns(self) -> list:
+        return list(self.dtypes)
+
+    @property
+    def key(self) -> str:
+        """Prefix for Streamlit widget keys."""
+        return self.name.lower()
+
+    @property
+    def bool_columns(self) -> list:
+        return [c for c, t in self.dtypes.items() if t is bool]
+
+    def label(self, column: str) -> str:
+        return self.labels.get(column, column)
+
+SCHEMAS = {}
+
+def register(schema: Schema) -> Schema:
+    SCHEMAS[schema.name] = schema
+    return schema
+
+HOUSING = register(Schema(
+    "Housing", "Data/Housing.csv",
+    {
+        "Name": str,
+        "Link": str,
+        "Adress": str,  # CSV uses 'Adress'
+        "Rent": int,
+        "Distance": float,
+        "Rooms": float,
+        "Size": float,
+        "Kitchen": bool,
+        "Furnished": bool,
+        "Rental Period": str,
+        "Parking": bool,
+        "Custom": str,
+    },
+    axes=["Distance", "Rent", "Rooms", "Size"],
+    hue=["Rooms", "Distance", "Size", "Kitchen", "Furnished", "Parking"],
+    size=["Rent", "Distance", "Rooms", "Size"],
+    labels={
+        "Rent": "Rent / Miete",
+        "Rooms": "Rooms / Räume",
+        "Size": "Size / Größe",
+        "Kitchen": "Kitchen / Küche",
+        "Furnished": "Furnished / Möbliert",
+        "Rental Period": "Rental Period / Mietzeitraum",
+        "Parking": "Parking / Parkplatz",
+        "Custom": "Custom / Notizen",
+    },
+))
+
+HOTELS = register(Schema(
+    "Hotels", "Data/Hotel.csv",
+    {
+        "Name": str,
+        "Link": str,
+        "Adress": str,
+        "Rent": int,
+        "Distance": float,
+        "Rooms": float,
+        "Size": float,
+        "Kitchen": bool,
+        "Provided Food": bool,
+        "Rental Period": str,
+        "Custom": str,
+    },
+    axes=["Distance", "Rent", "Rooms", "Size"],
+))
+
+ACTIVITIES = register(Schema(
+    "Activities", "Data/Activities.csv",
+    {
+        "row_id": int,
+        "Name": str,
+        "Link": str,
+        "Address": str,
+        "Price_per_month": float,
+        "Distance": float,
+        "Duration_per_week": float,
+        "Group_Size": int,
+        "Trainer_Coach": bool,
+        "Equipment_Provided": bool,
+        "Food_Drinks": bool,
+        "Period": str,
+        "Custom": str,
+    },
+    axes=["Distance", "Price_per_month", "Duration_per_week", "Group_Size"],
+    generated=["row_id"],
+))
+
+# ------------------------ Validation / Coercion ------------------------
+
+_TRUE = {"true", "1", "yes", "y", "ja", "x", "1.0"}
+_FALSE = {"false", "0", "no", "n", "nein", "", "nan", "0.0", "none"}
+
+def missing_columns(df: pd.DataFrame, schema: Schema) -> list:
+    return [c for c in schema.columns if c not in df.columns]
+
+def _coerce_bool(s: pd.Series):
+    if s.dtype == bool:
+        return s, 0
+    text = s.astype(str).str.strip().str.lower()
+    out = text.isin(_TRUE)
+    bad = ~(out | text.isin(_FALSE)) & s.notna()
+    return out, int(bad.sum())
+
+def _coerce_number(s: pd.Series, kind):
+    out = pd.to_numeric(s, errors="coerce")
+    bad = int((out.isna() & s.notna() & (s.astype(str).str.strip() != "")).sum())
+    if kind is int:
+        # plain int64 when complete, float64 (with NaN) otherwise
+        out = out.round().astype("int64") if out.notna().all() else out.astype(float).round()
+    else:
+        out = out.astype(float)
+    return out, bad
+
+def coerce(df: pd.DataFrame, schema: Schema) -> tuple:
+    """Cast ``df`` to the schema column by column (vectorized).
+
+    Returns (frame with exactly the schema columns, {column: number of
+    values that could not be converted}). Missing columns are added empty.
+    """
+    out = pd.DataFrame(index=df.index)
+    problems = {}
+    for col, kind in schema.dtypes.items():
+        s = df[col] if col in df.columns else pd.Series(np.nan, index=df.index, dtype=object)
+        if kind is bool:
+            out[col], bad = _coerce_bool(s)
+        elif kind in (int, float):
+            out[col], bad = _coerce_number(s, kind)
+        else:
+            out[col], bad = s.where(s.isna(), s.astype(str)).astype(object), 0
+        if bad:
+            problems[col] = bad
+    if "row_id" in schema.generated and "row_id" in out:
+        out["row_id"] = fill_row_ids(out["row_id"])
+    return out, problems
+
+def fill_row_ids(ids: pd.Series) -> pd.Series:
+    """Give rows without an id the next free ones."""
+    ids = pd.to_numeric(ids, errors="coerce")
+    missing = ids.isna()
+    if missing.any():
+        start = int(ids.max()) + 1 if ids.notna().any() else 0
+        ids[missing] = np.arange(start, start + int(missing.sum()))
+    return ids.astype("int64")
+
+# ------------------------ Load / Save ------------------------
+
+_cache = {}   # path -> (version, frame)
+
+def dataset_version(path: str) -> tuple:
+    """Cheap change marker for a CSV (mtime + size)."""
+    try:
+        st_ = os.stat(path)
+    except FileNotFoundError:
+        return (0, 0)
+    return (st_.st_mtime_ns, st_.st_size)
+
+def load(schema: Schema, path: str = None) -> pd.DataFrame:
+    """Read and coerce a category CSV; parsed once per file version."""
+    path = path or schema.path
+    version = dataset_version(path)
+    hit = _cache.get(path)
+    if hit is None or hit[0] != version:
+        if version == (0, 0):
+            raw = pd.DataFrame(columns=schema.columns)
+        else:
+            raw = pd.read_csv(path, dtype=str, keep_default_na=False, na_values=[""])
+        hit = (version, coerce(raw, schema)[0])
+        _cache[path] = hit
+    return hit[1].copy()
+
+def save(schema: Schema, df: pd.DataFrame, path: str = None) -> None:
+    path = path or schema.path
+    df.to_csv(path, index=False, columns=[c for c in schema.columns if c in df.columns])
+
+def parse_upload(data: bytes, schema: Schema) -> tuple:
+    """Parse uploaded CSV bytes; returns (frame, missing columns, problems)."""
+    raw = pd.read_csv(io.BytesIO(data), dtype=str, keep_default_na=False, na_values=[""])
+    missing = missing_columns(raw, schema)
+    if missing:
+        return raw, missing, {}
+    df, problems = coerce(raw, schema)
+    return df, [], problems
@@ -0,0 +1,114 @@
+import re
+from bisect import bisect_left
+
+import pandas as pd
+
+# ------------------------ Config ------------------------
+
+SEARCH_COLUMNS = ["Name", "Adress", "Rental Period", "Custom"]
+
+_TOKEN_RE = re.compile(r"\w+")
+_SCAN_LIMIT = 256  # below this many candidates, filter rows instead of expanding
+
+# ------------------------ Helpers ------------------------
+
+def tokenize(text) -> list:
+    """Case-folded word tokens ("Königstr. 5" -> ["königstr", "5"])."""
+    if text is None or (isinstance(text, float) and pd.isna(text)):
+        return []
+    return _TOKEN_RE.findall(str(text).casefold())
+
+def _document(row) -> str:
+    parts = []
+    for col in SEARCH_COLUMNS:
+        value = row.get(col)
+        if value is None or (isinstance(value, float) and pd.isna(value)):
+            continue
+        parts.append(str(value))
+    return " ".join(parts)
+
+# ------------------------ Index ------------------------
+
+class SearchIndex:
+    """In-memory inverted index over the text columns of a listing table.
+
+    Every query term is matched as a prefix against a sorted vocabulary,
+    terms are AND-ed. ``sync`` only re-tokenizes rows whose text changed,
+    so keeping the index current after an add, edit or upload costs a
+    string compare per row instead of a full rebuild.
+    """
+
+    def __init__(self) -> None:
+        self.postings = {}     # token -> set(row_id)
+        self.docs = {}         # row_id -> indexed text
+        self._vocab = []       # sorted tokens, rebuilt lazily
+        self._vocab_dirty = False
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def add(self, row_id, row) -> None:
+        text = _document(row)
+        if row_id in self.docs:
+            if self.docs[row_id] == text:
+                return
+            self.remove(row_id)
+        self.docs[row_id] = text
+        for token in set(tokenize(text)):
+            ids = self.postings.get(token)
+            if ids is None:
+                self.postings[token] = ids = set()
+                self._vocab_dirty = True
+            ids.add(row_id)
+
+    def remove(self, row_id) -> None:
+        text = self.docs.pop(row_id, None)
+        if text is None:
+            return
+        for token in set(tokenize(text)):
+            ids = self.postings.get(token)
+            if ids is None:
+                continue
+            ids.discard(row_id)
+            if not ids:
+                del self.postings[token]
+                self._vocab_dirty = True
+
+    def sync(self, df: pd.DataFrame) -> None:
+        """Bring the index in line with ``df`` (keyed on its index)."""
+        current = set(df.index)
+        for row_id in [r for r in self.docs if r not in current]:
+            self.remove(row_id)
+        cols = [c for c in SEARCH_COLUMNS if c in df.columns]
+        for row_id, row in zip(df.index, df[cols].to_dict("records")):
+            self.add(row_id, row)
+
+    def _expand(self, prefix: str) -> set:
+        if self._vocab_dirty:
+            self._vocab = sorted(self.postings)
+            self._vocab_dirty = False
+        ids = set()
+        i = bisect_left(self._vocab, prefix)
+        while i < len(self._vocab) and self._vocab[i].startswith(prefix):
+            ids |= self.postings[self._vocab[i]]
+            i += 1
+        return ids
+
+    def search(self, query: str) -> list:
+        """Row ids matching every term of ``query`` (prefix match), sorted."""
+        terms = sorted(set(tokenize(query)), key=len, reverse=True)
+        if not terms:
+            return sorted(self.docs)
+        result = None
+        for term in terms:
+            if result is not None and len(result) <= _SCAN_LIMIT:
+                result = {
+                    r for r in result
+                    if any(t.startswith(term) for t in tokenize(self.docs[r]))
+                }
+            else:
+                ids = self._expand(term)
+                result = ids if result is None else result & ids
+            if not result:
+                return []
+        return sorted(result)
@@ -0,0 +1,189 @@
+import numpy as np
+import pandas as pd
+
+# ------------------------ Config ------------------------
+
+# Weight of each feature after z-score normalization. Booleans count half
+# so that a missing kitchen does not outweigh a 300 € rent difference.
+FEATURE_WEIGHTS = {
+    "Rent": 1.0,
+    "Distance": 1.0,
+    "Rooms": 1.0,
+    "Size": 1.0,
+    "Rent_per_sqm": 1.0,
+    "Kitchen": 0.5,
+    "Furnished": 0.5,
+    "Parking": 0.5,
+}
+
+LEAF_SIZE = 64            # points per leaf, scored in one vectorized step
+FIRST_STEP_LEAVES = 8     # leaves scored in the first step, doubled every step
+QUERY_BATCH = 64          # query points handled together (bounds memory)
+BRUTE_FORCE_MAX = 8192    # below this many points a plain scan beats the tree
+
+# ------------------------ Features ------------------------
+
+def rent_per_sqm(df: pd.DataFrame) -> pd.Series:
+    """Rent / Size per row, 0 where Size is missing or not positive (as in the hover text)."""
+    size = pd.to_numeric(df["Size"], errors="coerce")
+    rent = pd.to_numeric(df["Rent"], errors="coerce")
+    return (rent / size).where(size > 0, 0.0)
+
+def feature_matrix(df: pd.DataFrame, weights: dict = None) -> np.ndarray:
+    """Weighted, z-score normalized feature vectors (one row per listing)."""
+    weights = FEATURE_WEIGHTS if weights is None else weights
+    cols = []
+    for name, weight in weights.items():
+        if name == "Rent_per_sqm":
+            values = rent_per_sqm(df)
+        else:
+            values = df[name]
+            if values.dtype == object:
+                values = values.map({"True": True, "False": False, True: True, False: False})
+            values = pd.to_numeric(values, errors="coerce")
+        values = values.to_numpy(dtype=float)
+        mean = np.nanmean(values) if np.isfinite(values).any() else 0.0
+        std = np.nanstd(values) if np.isfinite(values).any() else 0.0
+        values = np.where(np.isfinite(values), values, mean)
+        cols.append((values - mean) / (std if std > 0 else 1.0) * weight)
+    if not cols:
+        return np.empty((len(df), 0))
+    return np.column_stack(cols)
+
+# ------------------------ k-d tree ------------------------
+
+class KDTree:
+    """Static k-d tree for k-nearest-neighbour queries (Euclidean).
+
+    The data is split at the median of its widest feature until every
+    leaf holds at most ``leaf_size`` points. Leaves are stored padded in
+    one array, so a query batch is answered leaf-step by leaf-step: each
+    step scores every still-open query point against its next-closest
+    leaf at once, and a point is done as soon as no unseen leaf box can
+    beat its k-th distance. Up to ``BRUTE_FORCE_MAX`` points a plain
+    matrix scan is faster and is used instead.
+    """
+
+    def __init__(self, data: np.ndarray, leaf_size: int = LEAF_SIZE) -> None:
+        self.data = np.asarray(data, dtype=float)
+        self.leaf_size = max(1, leaf_size)
+        n, dims = self.data.shape if self.data.ndim == 2 else (len(self.data), 0)
+        self.order = np.arange(n)
+        self._sq_norms = np.einsum("nd,nd->n", self.data, self.data) if n else np.empty(0)
+        leaves = self._build() if n else []
+        width = max((end - start for start, end in leaves), default=0)
+        # per leaf: data positions (-1 = padding), points (inf = padding), bounding box
+        self.leaf_index = np.full((len(leaves), width), -1, dtype=int)
+        self.leaf_points = np.full((len(leaves), width, dims), np.inf)
+        self.lo = np.empty((len(leaves), dims))
+        self.hi = np.empty((len(leaves), dims))
+        for leaf, (start, end) in enumerate(leaves):
+            idx = self.order[start:end]
+            self.leaf_index[leaf, :len(idx)] = idx
+            self.leaf_points[leaf, :len(idx)] = self.data[idx]
+            self.lo[leaf] = self.data[idx].min(axis=0)
+            self.hi[leaf] = self.data[idx].max(axis=0)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def _build(self) -> list:
+        """Partition ``order`` in place; returns the (start, end) range of every leaf."""
+        leaves = []
+        stack = [(0, len(self.data))]
+        while stack:
+            start, end = stack.pop()
+            if end - start <= self.leaf_size:
+                leaves.append((start, end))
+                continue
+            idx = self.order[start:end]
+            points = self.data[idx]
+            dim = int(np.argmax(points.max(axis=0) - points.min(axis=0)))
+            mid = (end - start) // 2
+            # identical points split fine too, they just land on both sides
+            self.order[start:end] = idx[np.argpartition(points[:, dim], mid)]
+            stack.extend(((start, start + mid), (start + mid, end)))
+        return leaves
+
+    def query(self, points: np.ndarray, k: int = 1) -> tuple:
+        """Return (distances, positions), each of shape (len(points), k).
+
+        Missing neighbours (k > len(tree)) are padded with inf / -1.
+        """
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        dists = np.full((len(points), k), np.inf)   # squared until the end
+        positions = np.full((len(points), k), -1, dtype=int)
+        if not len(self.data) or k <= 0:
+            return dists, positions
+        for start in range(0, len(points), QUERY_BATCH):
+            part = slice(start, start + QUERY_BATCH)
+            if len(self.data) <= BRUTE_FORCE_MAX:
+                self._scan(points[part], dists[part], positions[part])
+            else:
+                self._query_batch(points[part], dists[part], positions[part])
+        return np.sqrt(dists), positions
+
+    def _scan(self, points: np.ndarray, dists: np.ndarray, positions: np.ndarray) -> None:
+        """Brute-force counterpart of ``_query_batch`` for small trees."""
+        k = min(dists.shape[1], len(self.data))
+        # |x - q|² = |x|² - 2 x·q + |q|², one matrix product instead of an (m, n, d) difference
+        all_d = self._sq_norms[None] - 2 * points @ self.data.T + (points ** 2).sum(axis=1)[:, None]
+        all_d = np.maximum(all_d, 0.0)
+        top = np.argpartition(all_d, k - 1, axis=1)[:, :k]
+        top_d = np.take_along_axis(all_d, top, axis=1)
+        order = np.argsort(top_d, axis=1)
+        dists[:, :k] = np.take_along_axis(top_d, order, axis=1)
+        positions[:, :k] = np.take_along_axis(top, order, axis=1)
+
+    def _query_batch(self, points: np.ndarray, dists: np.ndarray, positions: np.ndarray) -> None:
+        """Fill ``dists`` (squared) / ``positions`` in place for one batch of points."""
+        k = dists.shape[1]
+        # squared distance from every point to every leaf box, visited closest first
+        gap = np.maximum(self.lo[None] - points[:, None], 0) + np.maximum(points[:, None] - self.hi[None], 0)
+        bounds = np.einsum("mld,mld->ml", gap, gap)
+        visit = np.argsort(bounds, axis=1)
+        bounds = np.take_along_axis(bounds, visit, axis=1)
+        rows = np.arange(len(points))
+        step, width = 0, FIRST_STEP_LEAVES
+        while step < visit.shape[1]:
+            open_ = rows[bounds[:, step] < dists[:, -1]]
+            if not len(open_):
+                break
+            # the next ``width`` leaves of every open point; doubling keeps the step count low
+            leaves = visit[open_, step:step + width]
+            diff = self.leaf_points[leaves].reshape(len(open_), -1, points.shape[1]) - points[open_, None]
+            cand_d = np.concatenate([dists[open_], np.einsum("msd,msd->ms", diff, diff)], axis=1)
+            cand_p = np.concatenate([positions[open_], self.leaf_index[leaves].reshape(len(open_), -1)], axis=1)
+            top = np.argpartition(cand_d, k - 1, axis=1)[:, :k]
+            top_d = np.take_along_axis(cand_d, top, axis=1)
+            order = np.argsort(top_d, axis=1)
+            dists[open_] = np.take_along_axis(top_d, order, axis=1)
+            positions[open_] = np.take_along_axis(np.take_along_axis(cand_p, top, axis=1), order, axis=1)
+            step, width = step + width, width * 2
+
+# ------------------------ Lookup ------------------------
+
+class SimilarListings:
+    """k-d tree over the housing table, built once per dataset version."""
+
+    def __init__(self, df: pd.DataFrame, weights: dict = None) -> None:
+        self.labels = df.index.tolist()
+        self.features = feature_matrix(df, weights)
+        self.tree = KDTree(self.features)
+        self._position = {label: pos for pos, label in enumerate(self.labels)}
+
+    def query(self, row_ids, k: int = 5) -> dict:
+        """Batched lookup: {row_id: [(other_id, distance), ...]} without the row itself."""
+        row_ids = [r for r in row_ids if r in self._position]
+        if not row_ids:
+            return {}
+        points = self.features[[self._position[r] for r in row_ids]]
+        dists, positions = self.tree.query(points, k + 1)
+        result = {}
+        for row_id, drow, prow in zip(row_ids, dists, positions):
+            pairs = [
+                (self.labels[p], float(d)) for d, p in zip(drow, prow)
+                if p >= 0 and self.labels[p] != row_id
+            ]
+            result[row_id] = pairs[:k]
+        return result
@@ -0,0 +1,42 @@
+import pandas as pd
+
+from app_pages.dedup import drop_exact_duplicates, normalize_text
+
+
+def _frame(rows):
+    cols = ["Name", "Link", "Adress", "Rent", "Size", "Custom"]
+    return pd.DataFrame(rows, columns=cols)
+
+
+def test_near_report_uses_labels_after_drop():
+    df = _frame([
+        ["Flat A", "https://portal.de/expose/1", "Hauptstrasse 1", 900, 40, ""],
+        ["Flat A copy", "https://portal.de/expose/1?utm_source=x", "Hauptstrasse 1", 900, 40, ""],
+        ["Bright attic flat near park", "https://portal.de/expose/2", "Gartenweg 7", 1200, 60, "balcony"],
+        ["Bright attic flat near the park", "https://other.de/9", "Gartenweg 7a", 1210, 60, "balcony"],
+    ])
+    cleaned, near = drop_exact_duplicates(df)
+    assert len(cleaned) == 3
+    pairs = set(zip(near["row"], near["duplicate_of"]))
+    assert pairs == {(2, 1)}
+    assert cleaned.loc[1, "Name"] == "Bright attic flat near park"
+
+
+def test_near_hit_on_dropped_row_points_at_kept_row():
+    df = _frame([
+        ["Cosy two room flat old town", "https://portal.de/expose/5", "Marktplatz 3", 800, 50, ""],
+        ["Cosy two room flat in old town", "https://portal.de/expose/5", "Marktplatz 3", 800, 50, ""],
+        ["Cosy two room flat in the old town", "https://x.de/1", "Marktplatz 3a", 805, 50, ""],
+    ])
+    cleaned, near = drop_exact_duplicates(df)
+    assert len(cleaned) == 2
+    assert list(zip(near["row"], near["duplicate_of"])) == [(1, 0)]
+
+
+def test_normalize_text_expands_street_suffix_only():
+    assert normalize_text("Hauptstr. 5") == "hauptstrasse 5"
+    assert normalize_text("Hauptstr 5") == "hauptstrasse 5"
+    assert normalize_text("Haupt Str 5") == "haupt strasse 5"
+    assert normalize_text("Hauptstraße 5") == "hauptstrasse 5"
+    assert normalize_text("Mustr") == "mustr"
+    assert normalize_text("Café Mustr, Nähe Bahnhof") == "café mustr nähe bahnhof"
@@ -0,0 +1,72 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app_pages.link_check import (
+    LinkCache, check_links, STATUS_DEAD, STATUS_OK
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    codes = []
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        try:
+            time.sleep(0.05)  # keep requests overlapping
+            if self.path.startswith("/gone"):
+                code, headers = 404, {}
+            elif self.headers.get("If-None-Match") == '"v1"':
+                code, headers = 304, {}
+            else:
+                code, headers = 200, {"ETag": '"v1"'}
+            with cls.lock:
+                cls.codes.append(code)
+            self.send_response(code)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.active, _Handler.peak, _Handler.codes = 0, 0, []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_check_links_against_local_server(server, tmp_path):
+    urls = [f"{server}/listing/{i}" for i in range(6)] + [f"{server}/gone/1", "not a url"]
+    cache = LinkCache(str(tmp_path / "links.json"))
+
+    first = asyncio.run(check_links(urls, cache, per_host=2))
+    assert _Handler.peak == 2
+    assert first[f"{server}/gone/1"]["status"] == STATUS_DEAD
+    assert all(first[f"{server}/listing/{i}"]["status"] == STATUS_OK for i in range(6))
+    assert "not a url" not in first
+
+    _Handler.codes = []
+    second = asyncio.run(check_links(urls, LinkCache(cache.path), per_host=2))
+    assert _Handler.codes.count(304) == 6
+    assert all(second[f"{server}/listing/{i}"]["code"] == 304 for i in range(6))
+    assert all(second[f"{server}/listing/{i}"]["status"] == STATUS_OK for i in range(6))
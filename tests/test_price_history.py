@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+
+from app_pages.price_history import PriceHistory
+
+
+def _listings(rents):
+    return pd.DataFrame({
+        "Name": [f"Flat {i}" for i in range(len(rents))],
+        "Link": [f"https://portal.de/expose/{i}" for i in range(len(rents))],
+        "Adress": [f"Hauptstrasse {i}" for i in range(len(rents))],
+        "Rent": rents,
+    })
+
+
+def test_only_changed_values_are_recorded(tmp_path):
+    history = PriceHistory(str(tmp_path))
+    assert history.record(_listings([900, 1000]), ts="2026-01-01") == 2
+    assert history.record(_listings([900, 1000]), ts="2026-01-02") == 0
+    assert history.record(_listings([950, 1000]), ts="2026-01-03") == 1
+    assert len(history.segments()) == 2
+
+
+def test_blank_rent_is_not_recorded_again_and_again(tmp_path):
+    history = PriceHistory(str(tmp_path))
+    history.record(_listings([900]), ts="2026-01-03")
+    for day in ("2026-01-04", "2026-01-05", "2026-01-06"):
+        assert history.record(_listings([np.nan]), ts=day) == 0
+    # same answer from a fresh store that rebuilds its state from disk
+    assert PriceHistory(str(tmp_path)).record(_listings([np.nan]), ts="2026-01-07") == 0
+    assert history.record(_listings([920]), ts="2026-01-08") == 1
+
+    history.compact()
+    rows = history.read()
+    assert rows["Rent"].tolist() == [900, 920]
+    assert rows["Rent"].notna().all()
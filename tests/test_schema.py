@@ -0,0 +1,34 @@
+import pandas as pd
+
+from app_pages import schema
+from app_pages.schema import SCHEMAS, HOUSING, parse_upload
+
+
+def test_registry_holds_every_category():
+    assert set(SCHEMAS) == {"Housing", "Hotels", "Activities"}
+    assert SCHEMAS["Housing"] is HOUSING
+
+
+def test_parse_upload_coerces_by_schema():
+    data = (
+        "Name,Link,Adress,Rent,Distance,Rooms,Size,Kitchen,Furnished,Rental Period,Parking,Custom\n"
+        "Flat,,Hauptstrasse 1,900,1.5,2,50,ja,0,12,x,7\n"
+        "Loft,,Gartenweg 2,abc,,,,,,,,\n"
+    ).encode("utf-8")
+    df, missing, problems = parse_upload(data, HOUSING)
+    assert missing == []
+    assert problems == {"Rent": 1}
+    assert df.loc[0, "Rental Period"] == "12" and df.loc[0, "Custom"] == "7"
+    assert df["Kitchen"].tolist() == [True, False]
+    assert df.loc[0, "Parking"] and df.loc[0, "Rent"] == 900
+
+
+def test_parse_upload_reports_missing_columns():
+    _, missing, _ = parse_upload(b"Name,Link\nFlat,\n", SCHEMAS["Hotels"])
+    assert "Provided Food" in missing and "Name" not in missing
+
+
+def test_activities_get_row_ids():
+    raw = pd.DataFrame({"row_id": ["4", None], "Name": ["A", "B"]})
+    df, _ = schema.coerce(raw, SCHEMAS["Activities"])
+    assert df["row_id"].tolist() == [4, 5]
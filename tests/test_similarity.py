@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app_pages import similarity
+from app_pages.similarity import KDTree, SimilarListings
+
+
+def _brute_force(data, points, k):
+    d = ((points[:, None] - data[None]) ** 2).sum(axis=2)
+    return np.sqrt(np.sort(d, axis=1)[:, :k])
+
+
+@pytest.mark.parametrize("brute_force_max", [0, similarity.BRUTE_FORCE_MAX])
+@pytest.mark.parametrize("n", [1, 7, 64, 65, 3000])
+def test_kdtree_matches_brute_force(monkeypatch, brute_force_max, n):
+    monkeypatch.setattr(similarity, "BRUTE_FORCE_MAX", brute_force_max)
+    rng = np.random.default_rng(n)
+    data = rng.normal(size=(n, 8))
+    data[: n // 4] = data[0]  # identical rows must not break the splits
+    points = np.vstack([rng.normal(size=(150, 8)), data[:5]])
+    tree = KDTree(data)
+    for k in (1, 4, n + 2):
+        dists, positions = tree.query(points, k)
+        m = min(k, n)
+        np.testing.assert_allclose(dists[:, :m], _brute_force(data, points, m), atol=1e-6)
+        found = np.sqrt(((data[positions[:, :m]] - points[:, None]) ** 2).sum(axis=2))
+        np.testing.assert_allclose(found, dists[:, :m], atol=1e-6)
+        assert (positions[:, m:] == -1).all() and np.isinf(dists[:, m:]).all()
+
+
+def test_similar_listings_skips_the_row_itself():
+    df = pd.DataFrame({
+        "Rent": [900, 910, 2000, 905], "Distance": [1.0, 1.1, 9.0, 1.0],
+        "Rooms": [2, 2, 5, 2], "Size": [50, 51, 120, 50],
+        "Kitchen": [True, True, False, True], "Furnished": [False] * 4, "Parking": [False] * 4,
+    }, index=[10, 11, 12, 13])
+    result = SimilarListings(df).query([10], k=2)
+    assert [row_id for row_id, _ in result[10]] == [13, 11]